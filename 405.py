@@ -2,8 +2,10 @@ import requests
 
 def check_for_405_error(api_url, http_method):
     try:
-        response = requests.request(http_method, api_url)
-        if response.status_code == 405:
+        # ステータスコードだけを確認するので、レスポンス本文はダウンロードしない
+        with requests.request(http_method, api_url, stream=True) as response:
+            status_code = response.status_code
+        if status_code == 405:
             print("405 Unknown エラーが検知されました。")
             # その他の処理をここに追加する
         else:
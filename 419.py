@@ -2,16 +2,25 @@ import os
 import requests
 from requests.auth import HTTPBasicAuth
 
+# トークン取得とAPI呼び出しで同じ接続(TCP/TLS)を使い回すためのセッション
+session = requests.Session()
+
+# 応答がないままハングしないよう、各リクエストに設定するタイムアウト（秒）
+REQUEST_TIMEOUT = 10
+
 def check_for_419_error(url, client_id, client_secret):
+    # 初回と再試行で同じURLを使うため一度だけ組み立てる
+    user_url = url + '/api/user'
     try:
         # Passportクライアントを使用して認証を行う
         auth = HTTPBasicAuth(client_id, client_secret)
-        response = requests.post(url + '/oauth/token', auth=auth, data={'grant_type': 'client_credentials', 'scope': '*'})
+        response = session.post(url + '/oauth/token', auth=auth, data={'grant_type': 'client_credentials', 'scope': '*'}, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             access_token = response.json()['access_token']
-            headers = {'Authorization': 'Bearer ' + access_token}
-            response = requests.get(url + '/api/user', headers=headers)
+            # トークンの発行・更新のたびにセッションのヘッダーへ設定し、以降のリクエストで使う
+            session.headers['Authorization'] = 'Bearer ' + access_token
+            response = session.get(user_url, timeout=REQUEST_TIMEOUT)
 
             if response.status_code == 419:
                 print("419 Unknown エラーが検知されました。")
@@ -19,8 +28,8 @@ def check_for_419_error(url, client_id, client_secret):
                 updated_access_token = update_access_token(url, client_id, client_secret)
                 if updated_access_token:
                     print("アクセストークンを更新しました。再度リクエストを送信します。")
-                    headers = {'Authorization': 'Bearer ' + updated_access_token}
-                    response = requests.get(url + '/api/user', headers=headers)
+                    session.headers['Authorization'] = 'Bearer ' + updated_access_token
+                    response = session.get(user_url, timeout=REQUEST_TIMEOUT)
                     if response.status_code == 200:
                         print("リクエストは成功しました。")
                     else:
@@ -39,7 +48,7 @@ def update_access_token(url, client_id, client_secret):
     try:
         # Passportクライアントを使用して認証を行う
         auth = HTTPBasicAuth(client_id, client_secret)
-        response = requests.post(url + '/oauth/token', auth=auth, data={'grant_type': 'client_credentials', 'scope': '*'})
+        response = session.post(url + '/oauth/token', auth=auth, data={'grant_type': 'client_credentials', 'scope': '*'}, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             access_token = response.json()['access_token']
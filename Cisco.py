@@ -33,6 +33,15 @@ payload = """
 </config>
 """
 
+# Only retrieve the static route subtree instead of the whole running config
+route_filter = """
+<native xmlns="http://cisco.com/ns/yang/Cisco-IOS-XE-native">
+  <ip>
+    <route/>
+  </ip>
+</native>
+"""
+
 # Connect to NETCONF agent on the router
 with manager.connect(host='172.16.62.151', port=830, username='cisco', password='cisco', hostkey_verify=False, device_params={'name': 'iosxe'}) as m:
     print('###########################################################################')
@@ -45,8 +54,8 @@ with manager.connect(host='172.16.62.151', port=830, username='cisco', password=
     print('###########################################################################')
     print('### XML Formatted String')
     print('###########################################################################')
-    # Get running configuration
-    running_config = m.get_config(source='running').data_xml
+    # Get static routes from the running configuration
+    # data_ele is the already-parsed lxml element; avoids serializing to data_xml and parsing it again
+    data = m.get_config(source='running', filter=('subtree', route_filter)).data_ele
     # Print formatted XML
-    data = ET.fromstring(running_config)
     print(ET.tostring(data, pretty_print=True).decode())
\ No newline at end of file
@@ -1,7 +1,6 @@
 import subprocess
 import json
 import datetime
-from google.cloud import storage
 
 def get_app_engine_endpoint(project_id, service_name, version):
     """App Engineのエンドポイントを取得する関数"""
@@ -21,6 +20,7 @@ def get_app_engine_endpoint(project_id, service_name, version):
 
 def save_log_to_cloud_storage(bucket_name, log_data):
     """Save log to Cloud Storage"""
+    from google.cloud import storage  # 重いため使用時にのみ読み込む
     storage_client = storage.Client()
     bucket = storage_client.bucket(bucket_name)
     now = datetime.datetime.now()
@@ -31,12 +31,15 @@ def save_log_to_cloud_storage(bucket_name, log_data):
 
 def delete_old_logs(bucket_name):
     """Delete old logs from the specified Cloud Storage bucket"""
+    from google.cloud import storage  # 重いため使用時にのみ読み込む
     storage_client = storage.Client()
     bucket = storage_client.bucket(bucket_name)
     blobs = bucket.list_blobs()
+    # Delete logs older than 90 days
+    # time_created is timezone-aware (UTC), so compare against an aware cutoff computed once
+    cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=90)
     for blob in blobs:
-        # Delete logs older than 90 days
-        if (datetime.datetime.now() - blob.time_created).days >= 90:
+        if blob.time_created <= cutoff:
             blob.delete()
             print(f"Deleted old log: {blob.name}")
 
@@ -1,6 +1,9 @@
 import requests
 import json
 
+# ログインと設定変更で同じ接続（とログイン後のCookie）を使い回すためのセッション
+session = requests.Session()
+
 def get_router_ip():
     # ルーターのデフォルトゲートウェイを取得
     gateway = requests.get("https://ifconfig.co/").json()["gateway"]
@@ -14,7 +17,7 @@ def login_router(router_ip, username, password):
     # ルーターの設定画面にアクセス
     url = "http://" + router_ip + "/admin"
     payload = {"username": username, "password": password}
-    response = requests.post(url, data=payload)
+    response = session.post(url, data=payload)
 
     # ログインに成功したか確認
     if response.status_code == 200:
@@ -26,7 +29,7 @@ def change_router_setting(router_ip, setting_name, setting_value):
     # ルーターの設定画面にアクセス
     url = "http://" + router_ip + "/admin/settings/" + setting_name
     payload = {"setting_value": setting_value}
-    response = requests.post(url, data=payload)
+    response = session.post(url, data=payload)
 
     # 設定の変更に成功したか確認
     if response.status_code == 200:
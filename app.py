@@ -25,6 +25,9 @@ if os.path.exists(groundtruth_path):
 else:
     st.error('基準画像が見つかりません。')
 
+# ファイル名に使えない文字を置換するパターン（プロンプトごとに解釈しないよう事前コンパイル）
+NON_WORD_PATTERN = re.compile(r'\W+')
+
 # 生成された画像とSSIMスコアを保持するリスト
 images_ssim = []
 
@@ -34,15 +37,19 @@ prompts = st.text_area('複数の画像プロンプトを入力してくださ
 # 生成された画像を保持するリスト
 images = []
 
+# OpenAIクライアントはプロンプト間で使い回す（接続プールを共有）
+client = None
+
 # プロンプトが入力されたときに画像を生成
 for prompt in prompts:
     if prompt:
         # ファイル名をプロンプトから生成
-        file_name = re.sub(r'\W+', '_', prompt)[:20] + '.png'
+        file_name = NON_WORD_PATTERN.sub('_', prompt)[:20] + '.png'
 
         # OpenAI APIを使用して画像を生成
         try:
-            client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+            if client is None:
+                client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
             response = client.images.generate(
                 model="dall-e-3",
                 prompt=prompt,
@@ -1,30 +1,38 @@
 import random
 import time
 
-def generate_danson():
-    # ダンソンのネタのリスト
-    danson_list = [
-        "ダンソン！",
-        "ダンソン！ダンソン！",
-        "ダンソン！ダンソン！ダンソン！",
-        "ダンソン！ダンソン！ダンソン！ダンソン！",
-        "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
-        "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
-        "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
-        "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
-    ]
+# ダンソンのネタのリスト（呼び出しごとに作り直さないようモジュール定数にする）
+DANSON_LIST = (
+    "ダンソン！",
+    "ダンソン！ダンソン！",
+    "ダンソン！ダンソン！ダンソン！",
+    "ダンソン！ダンソン！ダンソン！ダンソン！",
+    "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
+    "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
+    "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
+    "ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！ダンソン！",
+)
 
-    return random.choice(danson_list)
+def generate_danson():
+    return random.choice(DANSON_LIST)
 
 def main():
     try:
+        # 出力にかかった時間の分だけ間隔がずれないよう、単調増加時計で次の出力時刻を決める
+        deadline = time.monotonic()
         while True:
             # ダンソンのネタをランダムに選択
             danson = generate_danson()
             # ダンソンのネタを出力
-            print(danson)
-            # 1秒待機
-            time.sleep(1)
+            print(danson, flush=True)
+            # 次の出力時刻まで待機（1秒間隔）
+            deadline += 1
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                # 大きく遅れた場合は追いつこうとせず、現在時刻から数え直す
+                deadline = time.monotonic()
     except KeyboardInterrupt:
         print("プログラムを終了します。")
 
@@ -1,24 +1,99 @@
-import subprocess
+import os
+import re
+import shutil
+import tempfile
+from functools import lru_cache
 import boto3
 
+@lru_cache(maxsize=None)
+def get_rds_client(region):
+    """ Create the RDS client once per region and reuse it (and its connection pool) """
+    return boto3.client('rds', region_name=region)
+
 def get_rds_endpoint(region, db_instance_identifier):
-    rds_client = boto3.client('rds', region_name=region)
+    rds_client = get_rds_client(region)
     response = rds_client.describe_db_instances(DBInstanceIdentifier=db_instance_identifier)
     if response['DBInstances']:
         return response['DBInstances'][0]['Endpoint']['Address']
     return None
 
+# "[profile dev]" style section headers and top-level "key = value" lines
+# (indented lines are nested sub-settings such as "s3 =" blocks and are left alone)
+SECTION_PATTERN = re.compile(r'^\s*\[\s*(.*?)\s*\]')
+KEY_PATTERN = re.compile(r'^([^\s=#;\[][^=]*?)\s*=')
+
+def update_config_lines(lines, section, values):
+    """ Set keys in a section of AWS config lines, keeping comments and everything else as is """
+    remaining = dict(values)
+    result = []
+    in_section = False
+    insert_at = None
+    for line in lines:
+        match = SECTION_PATTERN.match(line)
+        if match:
+            in_section = ' '.join(match.group(1).split()) == section
+            result.append(line)
+            if in_section:
+                insert_at = len(result)
+            continue
+        if in_section:
+            key_match = KEY_PATTERN.match(line)
+            if key_match and key_match.group(1) in remaining:
+                key = key_match.group(1)
+                line = f'{key} = {remaining.pop(key)}\n'
+            if line.strip():
+                insert_at = len(result) + 1
+        result.append(line)
+    if remaining:
+        new_lines = [f'{key} = {value}\n' for key, value in remaining.items()]
+        if insert_at is None:
+            # Section does not exist yet: append it at the end of the file
+            new_lines.insert(0, f'[{section}]\n')
+            if result:
+                new_lines.insert(0, '\n')
+            insert_at = len(result)
+        if insert_at and not result[insert_at - 1].endswith('\n'):
+            result[insert_at - 1] += '\n'
+        result[insert_at:insert_at] = new_lines
+    return result
+
+def set_profile_config(profile, **values):
+    """ Write keys to the AWS CLI config file for the profile (same file `aws configure set` edits) """
+    config_path = os.path.expanduser(os.environ.get('AWS_CONFIG_FILE', '~/.aws/config'))
+    # Edit the real file behind a symlink rather than replacing the link itself
+    config_path = os.path.realpath(config_path)
+    config_dir = os.path.dirname(config_path)
+    section = profile if profile == 'default' else f'profile {profile}'
+    try:
+        with open(config_path) as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        lines = []
+    lines = update_config_lines(lines, section, values)
+    # Write to a private temporary file and swap it in so the config is never left half-written
+    if config_dir:
+        os.makedirs(config_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=config_dir or None)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.writelines(lines)
+        if os.path.exists(config_path):
+            shutil.copymode(config_path, tmp_path)
+        os.replace(tmp_path, config_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def switch_rds_endpoint(profile, region, db_instance_identifier):
-    """ Display RDS endpoint and switch configuration using AWS CLI """
+    """ Display RDS endpoint and switch configuration in the AWS CLI config """
     # Get RDS endpoint
     endpoint = get_rds_endpoint(region, db_instance_identifier)
     if endpoint:
         # Display endpoint
         print(f"RDS Endpoint: {endpoint}")
-        # Set default region for the profile using AWS CLI
-        subprocess.run(['aws', 'configure', 'set', 'region', region, '--profile', profile])
-        # Set RDS endpoint for the profile using AWS CLI
-        subprocess.run(['aws', 'configure', 'set', f'aws_rds_endpoint={endpoint}', '--profile', profile])
+        # Set default region and RDS endpoint for the profile in one write,
+        # instead of starting the AWS CLI once per key
+        set_profile_config(profile, region=region, aws_rds_endpoint=endpoint)
         print(f"Switched to RDS Endpoint: {endpoint}")
     else:
         print(f"Error: Unable to retrieve RDS Endpoint for {db_instance_identifier}")
@@ -28,4 +103,4 @@ if __name__ == "__main__":
     aws_profile = "your_aws_profile"
     aws_region = "your_aws_region"
     rds_instance_identifier = "your_rds_instance_identifier"
-    switch_rds_endpoint(aws_profile, aws_region, rds_instance_identifier)
\ No newline at end of file
+    switch_rds_endpoint(aws_profile, aws_region, rds_instance_identifier)
@@ -1,8 +1,10 @@
 import json
 import boto3
 
+# クライアントはハンドラーの外で作成し、ウォームスタート時の呼び出し間で使い回す
+client = boto3.client('elbv2')
+
 def lambda_handler(event, context):
-    client = boto3.client('elbv2')
     # 変更前のルールの優先順位を取得して保存
     original_rule_priorities = {}
     response = client.describe_rules(
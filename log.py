@@ -1,10 +1,11 @@
 import re
 from datetime import datetime
 
-def parse_clf_log(log_entry):
-    clf_pattern = r'(?P<host>[\d\.]+) - - \[(?P<timestamp>.*?)\] "(?P<request>.*?)" (?P<status>\d+) (?P<bytes_sent>\d+)'
+# 呼び出しごとにパターンを解釈しないよう、モジュール読み込み時に一度だけコンパイルする
+CLF_PATTERN = re.compile(r'(?P<host>[\d\.]+) - - \[(?P<timestamp>.*?)\] "(?P<request>.*?)" (?P<status>\d+) (?P<bytes_sent>\d+)')
 
-    match = re.match(clf_pattern, log_entry)
+def parse_clf_log(log_entry):
+    match = CLF_PATTERN.match(log_entry)
     if match:
         data = match.groupdict()
         data['timestamp'] = datetime.strptime(data['timestamp'], '%d/%b/%Y:%H:%M:%S %z')
@@ -28,10 +29,11 @@ else:
 import re
 from datetime import datetime
 
-def parse_clf_log(log_entry):
-    clf_pattern = r'(?P<host>[\d\.]+) - - \[(?P<timestamp>.*?)\] "(?P<request>.*?)" (?P<status>\d+) (?P<bytes_sent>\d+)'
+# 呼び出しごとにパターンを解釈しないよう、モジュール読み込み時に一度だけコンパイルする
+CLF_PATTERN = re.compile(r'(?P<host>[\d\.]+) - - \[(?P<timestamp>.*?)\] "(?P<request>.*?)" (?P<status>\d+) (?P<bytes_sent>\d+)')
 
-    match = re.match(clf_pattern, log_entry)
+def parse_clf_log(log_entry):
+    match = CLF_PATTERN.match(log_entry)
     if match:
         data = match.groupdict()
         data['timestamp'] = datetime.strptime(data['timestamp'], '%d/%b/%Y:%H:%M:%S %z')